@@ -1,52 +1,80 @@
 import os
+import queue
 import threading
 import hashlib
 import logging
 import sqlite3
-from typing import Optional, Tuple
-from urllib.parse import urlparse
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 class LyricsDatabase:
     EXPIRY_DAYS = 24  # Cache expiry duration in days
+    READ_POOL_SIZE = 4  # Number of pooled read-only connections
+    SCHEMA_VERSION = 5  # Stored in PRAGMA user_version
 
     def __init__(self, db_path: str = "../cache/lyrics.db") -> None:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
-        self.local = threading.local()
         self.init_db()
+        self._write_conn = self._connect()
+        self._write_lock = threading.Lock()
+        # LIFO hands out the most recently used connection, whose page cache is warmest
+        self._read_pool: queue.LifoQueue = queue.LifoQueue(maxsize=self.READ_POOL_SIZE)
+        for _ in range(self.READ_POOL_SIZE):
+            self._read_pool.put(self._connect())
 
     @staticmethod
-    def get_cache_key(title: str, artist: str, language: str = "original") -> str:
-        key = f"{title.lower()}_{artist.lower()}_{language.lower()}"
-        return hashlib.md5(key.encode()).hexdigest()
+    @lru_cache(maxsize=4096)
+    def get_cache_key(title: str, artist: str, language: str = "original") -> bytes:
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(title.lower().encode())
+        hasher.update(b"_")
+        hasher.update(artist.lower().encode())
+        hasher.update(b"_")
+        hasher.update(language.lower().encode())
+        return hasher.digest()
     
     @staticmethod
     def _extract_base_url(spotify_url: str) -> str:
-        parsed_url = urlparse(spotify_url)
-        return f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+        return spotify_url.partition('?')[0].partition('#')[0]
 
-    def _get_connection(self) -> sqlite3.Connection:
-        if not hasattr(self.local, 'conn'):
-            self.local.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        return self.local.conn
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        # WAL lets background tasks read while another thread writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Wait for a competing writer (another worker process) instead of failing with "database is locked"
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def _read_conn(self) -> Iterator[sqlite3.Connection]:
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    @contextmanager
+    def _write_conn_locked(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            with self._write_conn:
+                yield self._write_conn
 
     def init_db(self) -> None:
-        conn = self._get_connection()
+        conn = self._connect()
+        if (conn.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION and
+                conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'lyrics'").fetchone()):
+            self._migrate(conn)
         with conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS lyrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    cache_key TEXT UNIQUE,
-                    title TEXT,
-                    artist TEXT,
-                    language TEXT,
-                    lyrics TEXT,
-                    timestamp DATETIME,
-                    UNIQUE(title, artist, language)
-                )
-            """)
+            self._create_lyrics_table(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS spotify_cache (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,53 +84,120 @@ class LyricsDatabase:
                     timestamp DATETIME
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_key ON lyrics(cache_key)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON lyrics(timestamp)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_spotify_url ON spotify_cache(spotify_url)")
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            # Expired rows are never served, so clear them in bulk once per start
+            conn.execute("DELETE FROM lyrics WHERE expires_at <= ?", (int(time.time()),))
+            conn.execute("DELETE FROM spotify_cache WHERE timestamp <= datetime('now', '-24 hours')")
+        conn.close()
+
+    def close(self) -> None:
+        """Refresh planner statistics and close every pooled connection."""
+        with self._write_lock:
+            try:
+                self._write_conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.error(f"PRAGMA optimize failed: {e}")
+            self._write_conn.close()
+        for _ in range(self.READ_POOL_SIZE):
+            self._read_pool.get().close()
+
+    @staticmethod
+    def _create_lyrics_table(conn: sqlite3.Connection, table: str = "lyrics") -> None:
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                cache_key BLOB PRIMARY KEY,
+                title TEXT,
+                artist TEXT,
+                language TEXT,
+                lyrics TEXT,
+                expires_at INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Rebuild the original lyrics table in the current schema.
+
+        The original table keyed rows on an MD5 hex digest and stored DATETIME text timestamps. Every
+        row is re-keyed from its title, artist and language into a WITHOUT ROWID table clustered on
+        the BLAKE2b digest that stores the expiry time. Everything runs in one transaction, so a
+        failure leaves the original table and user_version untouched for the next start.
+        """
+        expiry = self.EXPIRY_DAYS * 86400
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Rows without text keys could never have been looked up, so they are not carried over
+            rows = conn.execute("""
+                SELECT title, artist, language, lyrics, CAST(strftime('%s', timestamp) AS INTEGER) FROM lyrics
+                WHERE typeof(title) = 'text' AND typeof(artist) = 'text' AND typeof(language) = 'text'
+            """).fetchall()
+            conn.execute("DROP TABLE IF EXISTS lyrics_new")
+            self._create_lyrics_table(conn, "lyrics_new")
+            conn.executemany(
+                "INSERT OR REPLACE INTO lyrics_new (cache_key, title, artist, language, lyrics, expires_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(self.get_cache_key(title, artist, language), title, artist, language, lyrics, (saved_at or 0) + expiry)
+                 for title, artist, language, lyrics, saved_at in rows]
+            )
+            # Dropping the old table also drops its idx_cache_key and idx_timestamp indexes
+            conn.execute("DROP TABLE lyrics")
+            conn.execute("ALTER TABLE lyrics_new RENAME TO lyrics")
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute("ANALYZE")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        if rows:
+            logger.info(f"Migrated {len(rows)} cached lyrics entries")
 
     def get_cached_data(self, title: str, artist: str, language: str = "original") -> Optional[str]:
         cache_key = self.get_cache_key(title, artist, language)
-        query = f"""
-            SELECT lyrics FROM lyrics
-            WHERE cache_key = ? AND
-                  datetime(timestamp) > datetime('now', '-{self.EXPIRY_DAYS} days')
-        """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, (cache_key,))
-        result = cursor.fetchone()
+        with self._read_conn() as conn:
+            result = conn.execute("""
+                SELECT lyrics FROM lyrics
+                WHERE cache_key = ? AND expires_at > ?
+            """, (cache_key, int(time.time()))).fetchone()
         if result:
             logger.info(f"Cache hit for '{title}' by '{artist}' with language '{language}'")
             return result[0]
         return None
 
     def save_to_cache(self, title: str, artist: str, lyrics: str, language: str = "original") -> None:
-        cache_key = self.get_cache_key(title, artist, language)
-        conn = self._get_connection()
-        with conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO lyrics (cache_key, title, artist, language, lyrics, timestamp)
-                VALUES (?, ?, ?, ?, ?, datetime('now'))
-            """, (cache_key, title, artist, language, lyrics))
+        self.save_to_cache_many([(title, artist, lyrics, language)])
+
+    def save_to_cache_many(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Upsert (title, artist, lyrics, language) rows in a single transaction."""
+        expires_at = int(time.time()) + self.EXPIRY_DAYS * 86400
+        params = [
+            (self.get_cache_key(title, artist, language), title, artist, language, lyrics, expires_at)
+            for title, artist, lyrics, language in rows
+        ]
+        with self._write_conn_locked() as conn:
+            conn.executemany("""
+                INSERT INTO lyrics (cache_key, title, artist, language, lyrics, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    title = excluded.title,
+                    artist = excluded.artist,
+                    language = excluded.language,
+                    lyrics = excluded.lyrics,
+                    expires_at = excluded.expires_at
+            """, params)
 
     def delete_cached_lyrics(self, title: str, artist: str, language: str) -> None:
         cache_key = self.get_cache_key(title, artist, language)
-        conn = self._get_connection()
-        with conn:
+        with self._write_conn_locked() as conn:
             conn.execute("DELETE FROM lyrics WHERE cache_key = ?", (cache_key,))
         logger.info(f"Deleted cached lyrics for '{title}' by '{artist}' with language '{language}'")
 
     def get_cached_spotify_track(self, spotify_url: str) -> Optional[Tuple[str, str]]:
         base_url = self._extract_base_url(spotify_url)
-        conn = self._get_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute("""
-                SELECT title, artist FROM spotify_cache
-                WHERE spotify_url = ? AND
-                      datetime(timestamp) > datetime('now', '-24 hours')
-            """, (base_url,))
-            result = cursor.fetchone()
+            with self._read_conn() as conn:
+                result = conn.execute("""
+                    SELECT title, artist FROM spotify_cache
+                    WHERE spotify_url = ? AND timestamp > datetime('now', ?)
+                """, (base_url, '-24 hours')).fetchone()
             if result:
                 logger.info(f"Spotify cache hit for URL: {base_url}")
                 return result
@@ -112,9 +207,8 @@ class LyricsDatabase:
 
     def cache_spotify_track(self, spotify_url: str, title: str, artist: str) -> None:
         base_url = self._extract_base_url(spotify_url)
-        conn = self._get_connection()
         try:
-            with conn:
+            with self._write_conn_locked() as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO spotify_cache
                     (spotify_url, title, artist, timestamp)
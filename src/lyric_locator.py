@@ -2,19 +2,104 @@ import os
 import re
 import hashlib
 import logging
+import sqlite3
 import requests
-from difflib import SequenceMatcher
-from typing import Optional
-from bs4 import BeautifulSoup
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession
+from typing import Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+from rapidfuzz.distance import Indel
 from urllib.parse import unquote
 # local imports
 from database import LyricsDatabase
+from rate_limiter import RateLimitedAdapter, TokenBucket
 from spotify_handler import SpotifyHandler
 from transliteration import transliterate_arabic
 
 logger = logging.getLogger(__name__)
 
+_LYRICS_CONTAINER_ATTRS = {"data-lyrics-container": "true"}
+_MUSIXMATCH_TITLE_ATTRS = {"data-testid": "lyrics-track-title"}
+_LYRICS_CONTAINER_STRAINER = SoupStrainer("div", attrs=_LYRICS_CONTAINER_ATTRS)
+# Search result pages are mostly scripts and styles; only links or result divs are ever read
+_LINK_STRAINER = SoupStrainer("a", href=True)
+_DIV_STRAINER = SoupStrainer("div")
+# Only link targets count: inline scripts carry JS-escaped URLs (e.g. ...-lyrics\x22) that are not cut off cleanly
+_GENIUS_LINK_RE = re.compile(rb'href="(?:/url\?q=)?(https?://genius\.com/[^\s&"\'<>\\]+)')
+_GENIUS_HREF_RE = re.compile(r'(https?://genius\.com/[^\s&]+)')
+_MUSIXMATCH_HREF_RE = re.compile(r'(https?://www\.musixmatch\.com/lyrics/[^\s&]+)')
+_TRANSLATION_SUFFIX_RE = re.compile(r'/translation/.*$')
+_REMIX_RE = re.compile(r'\s*\(.*remix.*\)', re.IGNORECASE)
+_BARE_PAREN_RE = re.compile(r'\([^)]*\)')
+_NON_WORD_RE = re.compile(r'[^\w\s\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]')
+_PAREN_RE = re.compile(r'\s*\([^)]*\)')
+_PAREN_LAZY_RE = re.compile(r'\s*\(.*?\)')
+_PAREN_CONTENT_RE = re.compile(r'\((.*?)\)')
+_FEAT_RE = re.compile(r'\b(feat\.|ft\.)\s+\w+', re.IGNORECASE)
+_ARTIST_SPLIT_RE = re.compile(r'[;,]')
+# Google panels that mention several of these are streaming/metadata cards rather than lyrics
+_PROBLEMATIC_KEYWORDS = ("Genres", "Dance-pop", "Electronic dance music", "K-pop", "Spotify", "Apple Music", "YouTube", "YouTube Music", "Deezer", "Artist", "Album")
+_CREDIT_PREFIXES = ("Source:", "Songwriters:")
+_REFORMAT_PATTERNS = [(re.compile(pattern), repl) for pattern, repl in [
+    (r'\[\s*([^]]*?)\s*&\s*(?:\r?\n\s*)?([^]]*?)\s*\]', r'[\1 & \2]'),
+    (r'\[([^]]+?):\s*([^]]+?)\s*&\s*(?:\r?\n\s*)?([^]]+?)\s*\]', r'[\1: \2 & \3]'),
+    (r'\[([^\]]+?)\s*\r?\n\s*([^\]]+?)\]', r'[\1 \2]'),
+    (r'([(\[])\s*\r?\n\s*', r'\1'),
+    (r'\s+([)\]])', r'\1'),
+    (r'\s*!\s*', '! '),
+    (r'¡\s+', '¡'),
+    (r'([.!?])\s+(?![^\(]*\))(?=[A-Z])', r'\1\n'),
+    (r'\n{2,}', '\n\n'),
+    (r']\s*([A-Za-z¡])', r']\n\1'),
+    (r'\(\\s*', '('),
+    (r'\s*\)', ')'),
+    (r'\n\s*\(', ' ('),
+    (r'(?<!\n)\n?\s*\[([^\]]+)\]', r'\n\n[\1]'),
+    (r'\n\s*\[Instrumental\]\s*\n', r'\n\n[Instrumental]\n\n'),
+]]
+
+def _split_google_divs(soup) -> Tuple[list, list]:
+    """Collect the artist and lyrics candidate divs of a Google result page in one walk."""
+    artist_divs, lyrics_divs = [], []
+    for div in soup.find_all('div'):
+        classes = div.get('class', ())
+        if 'rVusze' in classes or ' '.join(classes) == 'iAIpCb PZPZlf':
+            artist_divs.append(div)
+        if 'ujudUb' in classes or 'PZPZlf' in classes or div.has_attr('data-lyricid'):
+            lyrics_divs.append(div)
+    return artist_divs, lyrics_divs
+
+def _is_musixmatch_lyrics_span(tag) -> bool:
+    classes = tag.get('class', ())
+    return 'css-175oi2r' in classes and 'r-zd98yo' in classes
+
+def _is_musixmatch_content(name, attrs) -> bool:
+    # Called by the parser with raw attributes, so class is still a space-separated string
+    if attrs.get('data-testid') == 'lyrics-track-title':
+        return True
+    classes = attrs.get('class', '').split()
+    return 'css-175oi2r' in classes and 'r-zd98yo' in classes
+
+_MUSIXMATCH_STRAINER = SoupStrainer(_is_musixmatch_content)
+
 class LyricLocate:
+    REQUEST_TIMEOUT = (5, 15)  # Connect and read timeouts in seconds
+    HTTP_CACHE_PURGE_INTERVAL = 3600  # Seconds between sweeps of expired HTTP cache responses
+
     def __init__(self):
         self.api_key = os.getenv("GENIUS_CLIENT_ACCESS_TOKEN")
         self.genius_headers = {'Authorization': f'Bearer {self.api_key}'} if self.api_key else {}
@@ -25,7 +110,37 @@ class LyricLocate:
         }
         self.google_params = {'hl': 'en'}
         self.db = LyricsDatabase()
-        self.spotify_handler = SpotifyHandler()
+        # Identical searches and page fetches within an hour (retries, language variants) skip the network
+        self.session = CachedSession(
+            cache_name=self.db.db_path.replace('.db', '_http.db'),
+            backend='sqlite',
+            expire_after=3600,
+            allowable_methods=('GET',),
+            stale_if_error=True
+        )
+        # requests-cache never evicts on its own; drop expired pages at start and then periodically
+        self.session.cache.delete(expired=True)
+        self._http_cache_purged_at = time.monotonic()
+        self._http_cache_purge_lock = threading.Lock()
+        # Transient server errors are retried with backoff. 429s are left to the token buckets below: urllib3
+        # retries happen inside one adapter send, so they would bypass the bucket, and an uncapped Retry-After
+        # sleep could outlast REQUEST_TIMEOUT. find_genius_url bails out on the first 429 instead.
+        retries = Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=False, raise_on_status=False
+        )
+        # Throttle ourselves rather than spend round-trips on 429s; cached responses never reach the adapter
+        buckets = {
+            'api.genius.com': TokenBucket(rate=5, capacity=5),
+            'www.google.com': TokenBucket(rate=1, capacity=3, jitter=0.25),
+        }
+        adapter = RateLimitedAdapter(buckets, pool_connections=32, pool_maxsize=64, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self._inflight: Dict[Tuple[bytes, bool, bool], Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.spotify_handler = SpotifyHandler(self.db)
 
         if not self.api_key:
             logger.warning("GENIUS_CLIENT_ACCESS_TOKEN not set - lyrics searches will be limited")
@@ -45,17 +160,36 @@ class LyricLocate:
     
     @staticmethod
     def normalize_text(text: str) -> str:
-        text = re.sub(r'\([^)]*\)', '', text)
-        text = re.sub(r'[^\w\s\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]', '', text)
+        text = _BARE_PAREN_RE.sub('', text)
+        text = _NON_WORD_RE.sub('', text)
         return text.lower().strip()
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def clean_title(title: str) -> str:
-        return re.sub(r'\b(feat\.|ft\.)\s+\w+', '', title, flags=re.IGNORECASE).strip().lower() if title else title
+        if not title:
+            return title
+        lowered = title.lower()
+        # Most titles credit no one, so skip the regex unless a marker is present
+        if 'feat.' not in lowered and 'ft.' not in lowered:
+            return lowered.strip()
+        return _FEAT_RE.sub('', title).strip().lower()
 
     @staticmethod
-    def clean_artists(artist: str) -> list:
-        return [name.strip() for name in re.split(r'[;,]', artist)] if artist else []
+    @lru_cache(maxsize=4096)
+    def clean_artists(artist: str) -> Tuple[str, ...]:
+        if not artist:
+            return ()
+        if ';' not in artist and ',' not in artist:
+            return (artist.strip(),)
+        return tuple(name.strip() for name in _ARTIST_SPLIT_RE.split(artist))
+
+    def close(self) -> None:
+        """Stop background fetches and release network and database resources."""
+        self.executor.shutdown(wait=True)
+        self.session.close()
+        self.spotify_handler.close()
+        self.db.close()
 
     def get_cached_data(self, title: str, artist: str, language: str = "original") -> Optional[str]:
         return self.db.get_cached_data(title, artist, language)
@@ -63,16 +197,23 @@ class LyricLocate:
     def save_to_cache(self, title: str, artist: str, lyrics: str, language: str = "original"):
         self.db.save_to_cache(title, artist, lyrics, language)
 
+    def save_to_cache_many(self, title: str, artist: str, lyrics: str, languages: list):
+        self.db.save_to_cache_many([(title, artist, lyrics, language) for language in languages])
+
     def is_lyrics_in_english(self, lyrics: str) -> bool:
         if not lyrics:
             return False
-        num_ascii = sum(1 for c in lyrics if ord(c) < 128)
+        if lyrics.isascii():
+            return True
+        # The ascii codec drops non-ASCII characters in C, leaving one byte per ASCII character
+        num_ascii = len(lyrics.encode('ascii', 'ignore'))
         return (num_ascii / len(lyrics)) > 0.9
 
     def is_match(self, extracted_artist: str, extracted_title: str, expected_artist: str, expected_title: str) -> bool:
         logger.info(f"Comparing '{extracted_artist}', '{extracted_title}' with '{expected_artist}', '{expected_title}'")
 
-        # Try matching without transliteration first
+        # Try matching without transliteration first; _try_match is memoised, so repeat candidates across
+        # retries and language variants are answered without re-scoring
         if self._try_match(extracted_artist, extracted_title, expected_artist, expected_title, use_transliteration=False):
             return True
 
@@ -83,7 +224,9 @@ class LyricLocate:
 
         return False
 
-    def _try_match(self, extracted_artist: str, extracted_title: str, expected_artist: str, expected_title: str, use_transliteration: bool) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _try_match(extracted_artist: str, extracted_title: str, expected_artist: str, expected_title: str, use_transliteration: bool) -> bool:
         if "(instrumental)" in extracted_title.lower():
             logger.info("Ignoring instrumental version.")
             return False
@@ -98,27 +241,35 @@ class LyricLocate:
             if not expected_artist.isascii():
                 expected_artist = transliterate_arabic(expected_artist)
 
-        query_artists = self.clean_artists(expected_artist)
-        query_title = self.clean_title(expected_title)
-        title_no_paren = re.sub(r'\s*\([^)]*\)', '', extracted_title).strip()
+        # clean_title already lowercases; everything else is lowercased once here
+        query_artists = [a.lower() for a in LyricLocate.clean_artists(expected_artist)]
+        query_title = LyricLocate.clean_title(expected_title)
+        extracted_artist = extracted_artist.lower()
+        extracted_title = extracted_title.lower()
+        title_no_paren = _PAREN_RE.sub('', extracted_title).strip()
 
-        artist_in_title = any(artist.lower() in extracted_artist.lower() for artist in query_artists)
-        title_in_result = query_title.lower() in title_no_paren.lower()
+        artist_in_title = any(artist in extracted_artist for artist in query_artists)
+        title_in_result = query_title in title_no_paren
 
         if artist_in_title and title_in_result:
             return True
 
-        if extracted_artist.lower() in ["genius romanizations", "genius english translations"]:
-            artist_match_ratio = 1.0
+        # Only whether a candidate clears the threshold matters, so stop at the first one that does
+        if extracted_artist in ["genius romanizations", "genius english translations"]:
+            artist_matches = True
         else:
-            artist_match_ratio = max(SequenceMatcher(None, a.lower(), extracted_artist.lower()).ratio() for a in query_artists)
-
-        parenthetical = re.findall(r'\((.*?)\)', extracted_title)
-        variants = [re.sub(r'\s*\(.*?\)', '', extracted_title).strip()] + parenthetical + [extracted_title]
+            artist_matches = any(Indel.normalized_similarity(a, extracted_artist, score_cutoff=0.45) > 0.45 for a in query_artists)
+        if not artist_matches:
+            return False
 
-        title_match_ratio = max(SequenceMatcher(None, query_title.lower(), variant.lower()).ratio() for variant in variants)
+        # Scored lazily, so parenthetical groups past the first passing variant are never extracted
+        variants = chain(
+            (_PAREN_LAZY_RE.sub('', extracted_title).strip(),),
+            (m.group(1) for m in _PAREN_CONTENT_RE.finditer(extracted_title)),
+            (extracted_title,),
+        )
 
-        return title_match_ratio > 0.6 and artist_match_ratio > 0.45
+        return any(Indel.normalized_similarity(query_title, variant, score_cutoff=0.6) > 0.6 for variant in variants)
 
     def reformat_lyrics_text(self, lyrics: str, language: str = None) -> str:
         unwanted_phrases = [
@@ -127,40 +278,16 @@ class LyricLocate:
             "Translate to English",
             "Musixmatch"
         ]
-        patterns = [
-            (r'\[\s*([^]]*?)\s*&\s*(?:\r?\n\s*)?([^]]*?)\s*\]', r'[\1 & \2]'),
-            (r'\[([^]]+?):\s*([^]]+?)\s*&\s*(?:\r?\n\s*)?([^]]+?)\s*\]', r'[\1: \2 & \3]'),
-            (r'\[([^\]]+?)\s*\r?\n\s*([^\]]+?)\]', r'[\1 \2]'),
-            (r'\(\s*\r?\n\s*', '('),
-            (r'\s*\r?\n\s*\)', ')'),
-            (r'\s+\)', ')'),
-            (r'\[\s*\r?\n\s*', '['),
-            (r'\s*\r?\n\s*\]', ']'),
-            (r'\s+\]', ']'),
-            (r'!\s*\r?\n\s*([A-Za-z])', r'! \1'),
-            (r'!\s+([A-Za-z])', r'! \1'),
-            (r'\s*!\s*', '! '),
-            (r'¡\s+', '¡'),
-            (r'([.!?])\s+(?![^\(]*\))(?=[A-Z])', r'\1\n'),
-            (r'\n{2,}', '\n\n'),
-            (r']\s*([A-Za-z¡])', r']\n\1'),
-            (r'\(\\s*', '('),
-            (r'\s*\)', ')'),
-            (r'\n\s*\(', ' ('),
-            (r'(?<!\n)\n?\s*\[([^\]]+)\]', r'\n\n[\1]'),
-            (r'\n\s*\[Instrumental\]\s*\n', r'\n\n[Instrumental]\n\n'),
-        ]
-        for pattern, repl in patterns:
-            lyrics = re.sub(pattern, repl, lyrics)
+        for pattern, repl in _REFORMAT_PATTERNS:
+            lyrics = pattern.sub(repl, lyrics)
         for phrase in unwanted_phrases:
             if phrase in lyrics:
-                lyrics = lyrics.split(phrase)[0].strip()
+                lyrics = lyrics.partition(phrase)[0].strip()
                 break
-        lyrics_lines = lyrics.split('\n')
-        lyrics_lines = [line for line in lyrics_lines if not line.startswith("Source:") and not line.startswith("Songwriters:")]
-
         if language == 'en':
-            lyrics_lines = [line for line in lyrics_lines if all(ord(c) < 128 for c in line)]
+            lyrics_lines = [line for line in lyrics.split('\n') if not line.startswith(_CREDIT_PREFIXES) and line.isascii()]
+        else:
+            lyrics_lines = [line for line in lyrics.split('\n') if not line.startswith(_CREDIT_PREFIXES)]
 
         return '\n'.join(lyrics_lines)
 
@@ -169,18 +296,20 @@ class LyricLocate:
             return None
         logger.info(f"Scraping lyrics from URL: {url}")
         try:
-            response = requests.get(url)
+            response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # All scraped sites serve UTF-8; parsing the raw bytes skips requests' charset guessing and decode
+            html = response.content
 
-            not_released_message = soup.find(string="Lyrics for this song have yet to be released. Please check back once the song has been released.")
-            if not_released_message:
+            if b"Lyrics for this song have yet to be released. Please check back once the song has been released." in html:
                 logger.info("Lyrics have not been released yet.")
                 return "Lyrics not found"
 
-            lyrics_containers = soup.find_all("div", attrs={"data-lyrics-container": "true"})
+            # Only the lyrics containers are needed, so skip building the rest of the page
+            soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_LYRICS_CONTAINER_STRAINER, from_encoding='utf-8')
+            lyrics_containers = soup.find_all("div", attrs=_LYRICS_CONTAINER_ATTRS)
             if not lyrics_containers:
-                if soup.find("div", string="This song is an instrumental"):
+                if b"This song is an instrumental" in html:
                     return "This song is an instrumental"
                 return None
             lyrics = "\n".join([container.get_text(separator="\n").strip() for container in lyrics_containers])
@@ -207,72 +336,89 @@ class LyricLocate:
 
         logger.info(f"Searching for Genius URL on google with query: {params['q']}")
         try:
-            response = requests.get(search_url, headers=headers, params=params)
+            response = self.session.get(search_url, headers=headers, params=params, timeout=self.REQUEST_TIMEOUT)
             if response.status_code == 429:
                 logger.error("API rate limit exceeded.")
                 return None
             response.raise_for_status()
             if self.api_key:
-                hits = response.json().get("response", {}).get("hits", [])
-                for hit in hits:
-                    result = hit['result']
-                    if self.is_match(result['primary_artist']['name'], result['title'], artist, title):
-                        return result['url']
-                # Retry with first artist if initial search fails
-                first_artist = self.clean_artists(artist)[0] if self.clean_artists(artist) else ""
-                if first_artist:
+                hits = _json_loads(response.content).get("response", {}).get("hits", [])
+                url = self._first_matching_hit(hits, artist, title)
+                if url:
+                    return url
+                # Retry with first artist if initial search fails; a lone artist would repeat the same search
+                artists = self.clean_artists(artist)
+                first_artist = artists[0] if artists else ""
+                if first_artist and first_artist != artist:
                     retry_query = f"{title} {first_artist}"
                     if language == 'en':
                         retry_query += ' english translation'
                     logger.info(f"Retrying search with first artist: {first_artist}, query: {retry_query}")
                     params['q'] = retry_query
-                    response = requests.get(search_url, headers=headers, params=params)
+                    response = self.session.get(search_url, headers=headers, params=params, timeout=self.REQUEST_TIMEOUT)
                     response.raise_for_status()
-                    hits = response.json().get("response", {}).get("hits", [])
-                    for hit in hits:
-                        result = hit['result']
-                        if self.is_match(result['primary_artist']['name'], result['title'], first_artist, title):
-                            return result['url']
+                    hits = _json_loads(response.content).get("response", {}).get("hits", [])
+                    url = self._first_matching_hit(hits, first_artist, title)
+                    if url:
+                        return url
             else:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                for a in soup.select('a[href]'):
+                # Scan the raw page first; building a tree is only needed if no link turns up
+                link_match = _GENIUS_LINK_RE.search(response.content)
+                if link_match:
+                    return link_match.group(1).decode('utf-8', 'ignore')
+                soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_LINK_STRAINER, from_encoding='utf-8')
+                for a in soup.find_all('a', href=True):
                     link = a['href']
                     if "genius.com" in link:
-                        link_match = re.search(r'(https?://genius\.com/[^\s&]+)', link)
+                        link_match = _GENIUS_HREF_RE.search(link)
                         if link_match:
                             return link_match.group()
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Search failed: {e}")
         return None
 
+    def _first_matching_hit(self, hits: list, artist: str, title: str) -> Optional[str]:
+        # Genius often lists the same song several times (versions, translations); score each pairing once
+        seen = set()
+        for hit in hits:
+            result = hit['result']
+            candidate = (result['primary_artist']['name'], result['title'])
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+            if self.is_match(*candidate, artist, title):
+                return result['url']
+        return None
+
+    def scrape_genius(self, title: str, artist: str, language: str = "original") -> Optional[str]:
+        genius_url = self.find_genius_url(title, artist, language)
+        return self.scrape_lyrics(genius_url) if genius_url else None
+
     def scrape_google(self, title: str, artist: str, language: str = "original") -> Optional[str]:
-        problematic_keywords = ["Genres", "Dance-pop", "Electronic dance music", "K-pop", "Spotify", "Apple Music", "YouTube", "YouTube Music", "Deezer", "Artist", "Album"]
+        query_title = self.clean_title(title)
+        first_artist = self.clean_artists(artist)[0]
+        suffix = "english translation lyrics" if language == 'en' else "lyrics"
         queries = [
-            f"{self.clean_title(title)} {self.clean_artists(artist)[0]} lyrics",
-            f"{self.clean_title(title)} lyrics"
+            f"{query_title} {first_artist} {suffix}",
+            f"{query_title} {suffix}"
         ]
-        if language == 'en':
-            queries = [
-                f"{self.clean_title(title)} {self.clean_artists(artist)[0]} english translation lyrics",
-                f"{self.clean_title(title)} english translation lyrics"
-            ]
         for query in queries:
             logger.info(f"Performing Google search with query: '{query}'")
             params = {**self.google_params, 'q': query}
             try:
-                response = requests.get("https://www.google.com/search", headers=self.google_headers, params=params)
+                response = self.session.get("https://www.google.com/search", headers=self.google_headers, params=params, timeout=self.REQUEST_TIMEOUT)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_DIV_STRAINER, from_encoding='utf-8')
+                artist_divs, lyrics_divs = _split_google_divs(soup)
 
                 if query.endswith('lyrics') and artist:
-                    extracted_artists = [div.get_text().strip() for div in soup.find_all('div', class_=['rVusze', 'iAIpCb PZPZlf'])]
-                    if not any(self.is_match(extracted_artist, "", artist, "") for extracted_artist in extracted_artists):
+                    if not any(self.is_match(div.get_text().strip(), "", artist, "") for div in artist_divs):
                         continue
 
-                for div in soup.select('div.ujudUb, div.PZPZlf, div[data-lyricid]'):
+                for div in lyrics_divs:
                     lyrics = div.get_text(separator='\n').strip()
                     if len(lyrics.split('\n')) > 4: # If the content has more than N lines, it is likely to be actual lyrics
-                        found_keywords = [keyword for keyword in problematic_keywords if keyword in lyrics]
+                        found_keywords = [keyword for keyword in _PROBLEMATIC_KEYWORDS if keyword in lyrics]
                         if len(found_keywords) >= 3:
                             logger.info(f"Skipping lyrics due to problematic keywords: {found_keywords}")
                             logger.info(f"Problematic lyrics: {lyrics}")
@@ -292,28 +438,28 @@ class LyricLocate:
         params = {**self.google_params, 'q': query}
         
         try:
-            response = requests.get("https://www.google.com/search", headers=self.google_headers, params=params)
+            response = self.session.get("https://www.google.com/search", headers=self.google_headers, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_LINK_STRAINER, from_encoding='utf-8')
             
-            for a in soup.select('a[href]'):
+            for a in soup.find_all('a', href=True):
                 link = a['href']
                 if "musixmatch.com/lyrics" in link:
-                    url_match = re.search(r'(https?://www\.musixmatch\.com/lyrics/[^\s&]+)', link)
+                    url_match = _MUSIXMATCH_HREF_RE.search(link)
                     if url_match:
                         lyrics_url = unquote(url_match.group())
                         
                         if language != 'en':
-                            lyrics_url = re.sub(r'/translation/.*$', '', lyrics_url)
+                            lyrics_url = _TRANSLATION_SUFFIX_RE.sub('', lyrics_url)
                         
                         logger.info(f"Found Musixmatch URL: {lyrics_url}")
                         try:
-                            lyrics_response = requests.get(lyrics_url, headers=self.google_headers)
+                            lyrics_response = self.session.get(lyrics_url, headers=self.google_headers, timeout=self.REQUEST_TIMEOUT)
                             lyrics_response.raise_for_status()
-                            lyrics_soup = BeautifulSoup(lyrics_response.text, 'html.parser')
+                            lyrics_soup = BeautifulSoup(lyrics_response.content, _HTML_PARSER, parse_only=_MUSIXMATCH_STRAINER, from_encoding='utf-8')
                             
                             # Simple fuzzy match on title
-                            title_element = lyrics_soup.find(attrs={"data-testid": "lyrics-track-title"})
+                            title_element = lyrics_soup.find(attrs=_MUSIXMATCH_TITLE_ATTRS)
                             if title_element:
                                 page_title = title_element.get_text().lower()
                                 search_title = title.lower()
@@ -325,7 +471,7 @@ class LyricLocate:
                                     artist = transliterate_arabic(artist)
                                 
                                 if self.is_match(extracted_artist=artist, extracted_title=page_title, expected_artist=artist, expected_title=search_title):
-                                    lyrics_spans = lyrics_soup.select('.css-175oi2r.r-zd98yo')
+                                    lyrics_spans = lyrics_soup.find_all(_is_musixmatch_lyrics_span)
                                     if lyrics_spans:
                                         lyrics = "\n".join(span.get_text(separator="\n").strip() for span in lyrics_spans)
                                         return self.reformat_lyrics_text(lyrics, language)
@@ -352,8 +498,42 @@ class LyricLocate:
         if cached and cached != "Lyrics not found":
             return cached
 
+        # Coalesce concurrent lookups for the same song so only one of them hits the network
+        key = (self.db.get_cache_key(title, artist, language), should_cache, attempted_remix_removal)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        if not is_owner:
+            logger.info(f"Waiting for in-flight lookup of '{title}' by '{artist}' with language '{language}'")
+            return future.result()
+
+        try:
+            lyrics = self._fetch_lyrics(title, artist, language, should_cache, attempted_remix_removal)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(lyrics)
+            return lyrics
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _fetch_lyrics(
+        self,
+        title: str,
+        artist: str,
+        language: str,
+        should_cache: bool,
+        attempted_remix_removal: bool
+    ) -> str:
         if language == 'en':
-            original_lyrics = self.get_lyrics(title, artist, 'original', should_cache)
+            # Reuse cached original lyrics directly; only fetch them when the cache has nothing usable
+            original_lyrics = self.get_cached_data(title, artist, 'original')
+            if not original_lyrics or original_lyrics == "Lyrics not found":
+                original_lyrics = self.get_lyrics(title, artist, 'original', should_cache)
             if original_lyrics and original_lyrics != "Lyrics not found":
                 if self.is_lyrics_in_english(original_lyrics):
                     if should_cache:
@@ -362,11 +542,16 @@ class LyricLocate:
                 else:
                     logger.info("Original lyrics not in English. Searching for translation.")
 
-        genius_url = self.find_genius_url(title, artist, language)
-        lyrics = self.scrape_lyrics(genius_url) if genius_url else None
+        lyrics = self.scrape_genius(title, artist, language)
 
+        musixmatch_future = None
         if not lyrics:
+            # Google is only searched once Genius comes up empty, so its rate limit is spent on real fallbacks.
+            # Musixmatch is the last resort; start it now so it overlaps with the Google search.
+            musixmatch_future = self.executor.submit(self.scrape_musixmatch, title, artist, language)
             lyrics = self.scrape_google(title, artist, language)
+            if lyrics is not None:
+                musixmatch_future.cancel()
 
         if lyrics and lyrics != "Lyrics not found":
             if language == 'en':
@@ -379,13 +564,12 @@ class LyricLocate:
                     return "Lyrics not found"
             else:
                 if should_cache:
-                    self.save_to_cache(title, artist, lyrics, 'original')
-                    if self.is_lyrics_in_english(lyrics):
-                        self.save_to_cache(title, artist, lyrics, 'en')
+                    languages = ['original', 'en'] if self.is_lyrics_in_english(lyrics) else ['original']
+                    self.save_to_cache_many(title, artist, lyrics, languages)
                 return lyrics
 
         if lyrics is None:
-            lyrics = self.scrape_musixmatch(title, artist, language)
+            lyrics = musixmatch_future.result()
 
         if lyrics and lyrics != "Lyrics not found":
             if language == 'en':
@@ -398,13 +582,12 @@ class LyricLocate:
                     return "Lyrics not found"
             else:
                 if should_cache:
-                    self.save_to_cache(title, artist, lyrics, 'original')
-                    if self.is_lyrics_in_english(lyrics):
-                        self.save_to_cache(title, artist, lyrics, 'en')
+                    languages = ['original', 'en'] if self.is_lyrics_in_english(lyrics) else ['original']
+                    self.save_to_cache_many(title, artist, lyrics, languages)
                 return lyrics
 
         if not lyrics and not attempted_remix_removal and 'remix' in title.lower():
-            new_title = re.sub(r'\s*\(.*remix.*\)', '', title, flags=re.IGNORECASE).strip()
+            new_title = _REMIX_RE.sub('', title).strip()
             if new_title != title:
                 logger.info(f"No lyrics found. Retrying with title without remix: '{new_title}'")
                 lyrics = self.get_lyrics(new_title, artist, language, should_cache, attempted_remix_removal=True)
@@ -418,7 +601,7 @@ class LyricLocate:
         logger.info(f"Background Task: Fetching {language} lyrics for Title: '{title}', Artist: '{artist}'")
 
         if 'remix' in title.lower():
-            clean_title = re.sub(r'\s*\(.*remix.*\)', '', title, flags=re.IGNORECASE).strip()
+            clean_title = _REMIX_RE.sub('', title).strip()
             if clean_title != title:
                 logger.info(f"Background Task: Removing remix from title. New title: '{clean_title}'")
                 title = clean_title
@@ -428,3 +611,17 @@ class LyricLocate:
             logger.info(f"Background Task: {language.capitalize()} lyrics fetched and cached successfully.")
         else:
             logger.warning(f"Background Task: {language.capitalize()} lyrics could not be fetched.")
+        self._purge_http_cache_if_due()
+
+    def _purge_http_cache_if_due(self) -> None:
+        with self._http_cache_purge_lock:
+            now = time.monotonic()
+            if now - self._http_cache_purged_at < self.HTTP_CACHE_PURGE_INTERVAL:
+                return
+            self._http_cache_purged_at = now
+        try:
+            # Freed pages are reused by later responses, so the file stops growing without a full VACUUM
+            self.session.cache.delete(expired=True, vacuum=False)
+            logger.info("Purged expired HTTP cache responses")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to purge HTTP cache: {e}")
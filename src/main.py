@@ -6,6 +6,7 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Optional
 import uvicorn
+from contextlib import asynccontextmanager
 from lyric_locator import LyricLocate
 from dotenv import load_dotenv
 load_dotenv()
@@ -13,8 +14,14 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
 lyric_locator = LyricLocate()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    lyric_locator.close()
+
+app = FastAPI(lifespan=lifespan)
 STATIC_DIR = "../static"
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
@@ -0,0 +1,41 @@
+import random
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until the caller may send."""
+
+    def __init__(self, rate: float, capacity: int, jitter: float = 0.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token up front; a negative balance is the queue of callers already waiting
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait + random.uniform(0, self.jitter))
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from the host's bucket before each request it sends."""
+
+    def __init__(self, buckets: Dict[str, TokenBucket], **kwargs) -> None:
+        self.buckets = buckets
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        bucket = self.buckets.get(urlparse(request.url).hostname)
+        if bucket:
+            bucket.acquire()
+        return super().send(request, **kwargs)
@@ -1,59 +1,109 @@
 import os
+import re
+import html
 import base64
 import logging
+import threading
+import time
 import requests
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Tuple
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
 from database import LyricsDatabase
 
 logger = logging.getLogger(__name__)
 
+# Scheme (any case, as urlparse allows), host and a bare track/<id> path; anything after the ID other
+# than '/', '?' or '#' is rejected
+_TRACK_URL_RE = re.compile(r'(?i:https?)://(?:open\.)?spotify\.com/+track/([^/?#\s]+)/*(?:[?#]|\Z)')
+_OG_META_RE = re.compile(rb'<meta\s+property="og:(title|description)"\s+content="([^"]*)"')
+_OG_META_STRAINER = SoupStrainer('meta', property=['og:title', 'og:description'])
+
 class SpotifyHandler:
-    def __init__(self):
+    REQUEST_TIMEOUT = (5, 15)  # Connect and read timeouts in seconds
+    TOKEN_REFRESH_MARGIN = 60  # Seconds before expiry at which the access token is renewed
+    TOKEN_RETRY_DELAY = 30  # Seconds to wait before retrying a failed token request
+
+    def __init__(self, db: Optional[LyricsDatabase] = None):
         self.spotify_client_id = os.getenv("SPOTIFY_CLIENT_ID")
         self.spotify_client_secret = os.getenv("SPOTIFY_CLIENT_SECRET")
-        self.spotify_access_token = (
-            self._get_spotify_token()
+        # Token, API and page requests all reuse pooled keep-alive connections
+        self.session = requests.Session()
+        # 429s are not retried and Retry-After is ignored: urllib3 would sleep for the full header value,
+        # holding the request thread well past REQUEST_TIMEOUT
+        retries = Retry(
+            total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], respect_retry_after_header=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._spotify_basic_auth = (
+            "Basic " + base64.b64encode(f"{self.spotify_client_id}:{self.spotify_client_secret}".encode()).decode()
             if self.spotify_client_id and self.spotify_client_secret
             else None
         )
-        self.db = LyricsDatabase()
+        self.spotify_access_token: Optional[str] = None
+        self._token_refresh_at = 0.0
+        self._token_lock = threading.Lock()
+        if self.spotify_client_id and self.spotify_client_secret:
+            self._current_spotify_token()
+        # Reuse the caller's database rather than opening a second set of connections
+        self._owns_db = db is None
+        self.db = db if db is not None else LyricsDatabase()
+
+    def _current_spotify_token(self) -> Optional[str]:
+        """Return a valid access token, renewing it shortly before it expires"""
+        if not (self.spotify_client_id and self.spotify_client_secret):
+            return None
+        if time.monotonic() < self._token_refresh_at:
+            return self.spotify_access_token
+        with self._token_lock:
+            # Another thread may have renewed the token while we waited for the lock
+            if time.monotonic() >= self._token_refresh_at:
+                token = self._get_spotify_token()
+                if token:
+                    self.spotify_access_token, expires_in = token
+                    self._token_refresh_at = time.monotonic() + expires_in - self.TOKEN_REFRESH_MARGIN
+                else:
+                    self.spotify_access_token = None
+                    self._token_refresh_at = time.monotonic() + self.TOKEN_RETRY_DELAY
+            return self.spotify_access_token
 
-    def _get_spotify_token(self) -> Optional[str]:
-        """Get Spotify access token using client credentials"""
+    def _get_spotify_token(self) -> Optional[Tuple[str, int]]:
+        """Get Spotify access token and its lifetime in seconds using client credentials"""
         if not (self.spotify_client_id and self.spotify_client_secret):
             logger.warning("Spotify API credentials missing")
             return None
         try:
-            auth = base64.b64encode(f"{self.spotify_client_id}:{self.spotify_client_secret}".encode()).decode()
-            response = requests.post(
+            response = self.session.post(
                 "https://accounts.spotify.com/api/token",
-                headers={"Authorization": f"Basic {auth}"},
-                data={"grant_type": "client_credentials"}
+                headers={"Authorization": self._spotify_basic_auth},
+                data={"grant_type": "client_credentials"},
+                timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json().get("access_token")
+            token = response.json()
+            if token.get("access_token"):
+                return token["access_token"], token.get("expires_in", 3600)
         except requests.RequestException as e:
             logger.error(f"Failed to get Spotify token: {e}")
             pass
 
     def extract_track_id(self, spotify_url: str) -> Optional[str]:
-        try:
-            parsed = urlparse(spotify_url.split('?', 1)[0])
-            if parsed.netloc not in ['open.spotify.com', 'spotify.com']:
-                logger.warning(f"Invalid Spotify URL: {spotify_url}")
-                return None
-            path_parts = parsed.path.strip('/').split('/')
-            if len(path_parts) != 2 or path_parts[0] != 'track':
-                logger.warning(f"Invalid Spotify track URL: {spotify_url}")
-                return None
-            track_id = path_parts[1]
-            logger.info(f"Extracted Spotify track ID: {track_id}")
-            return track_id
-        except Exception as e:
-            logger.error(f"Failed to extract track ID from URL {spotify_url}: {e}")
-            pass
+        # urlparse dropped surrounding whitespace such as a trailing newline from pasted links
+        match = _TRACK_URL_RE.match(spotify_url.strip())
+        if not match:
+            logger.warning(f"Invalid Spotify track URL: {spotify_url}")
+            return None
+        track_id = match.group(1)
+        logger.info(f"Extracted Spotify track ID: {track_id}")
+        return track_id
 
     def get_track_info(self, spotify_url: str) -> Optional[Tuple[str, str]]:
         """Get track info from Spotify API or web scraping"""
@@ -65,8 +115,9 @@ class SpotifyHandler:
         if not track_id:
             return None
 
-        if self.spotify_access_token:
-            track_info = self._fetch_track_info_api(track_id)
+        access_token = self._current_spotify_token()
+        if access_token:
+            track_info = self._fetch_track_info_api(track_id, access_token)
             if track_info:
                 self.db.cache_spotify_track(spotify_url, *track_info)
                 return track_info
@@ -79,11 +130,12 @@ class SpotifyHandler:
 
         return None
 
-    def _fetch_track_info_api(self, track_id: str) -> Optional[Tuple[str, str]]:
+    def _fetch_track_info_api(self, track_id: str, access_token: str) -> Optional[Tuple[str, str]]:
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"https://api.spotify.com/v1/tracks/{track_id}",
-                headers={"Authorization": f"Bearer {self.spotify_access_token}"}
+                headers={"Authorization": f"Bearer {access_token}"},
+                timeout=self.REQUEST_TIMEOUT
             )
             response.raise_for_status()
             track = response.json()
@@ -96,19 +148,31 @@ class SpotifyHandler:
 
     def _fetch_track_info_scrape(self, spotify_url: str) -> Optional[Tuple[str, str]]:
         try:
-            response = requests.get(spotify_url)
+            response = self.session.get(spotify_url, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            title_tag = soup.find('meta', property='og:title')
-            artist_tag = soup.find('meta', property='og:description')
-            title = title_tag.get('content', '').split(' - ')[0].strip() if title_tag else ''
-            artist = artist_tag.get('content', '').split(' · ')[0].strip() if artist_tag else ''
+            meta = {}
+            for name, content in _OG_META_RE.findall(response.content):
+                meta.setdefault(name.decode(), html.unescape(content.decode('utf-8', 'replace')))
+            if len(meta) < 2:
+                # Attributes in an unexpected order or form; fall back to a real parse
+                soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_OG_META_STRAINER, from_encoding='utf-8')
+                for name in ('title', 'description'):
+                    tag = soup.find('meta', property=f'og:{name}')
+                    if tag:
+                        meta.setdefault(name, tag.get('content', ''))
+            title = meta.get('title', '').split(' - ')[0].strip()
+            artist = meta.get('description', '').split(' · ')[0].strip()
             if title and artist:
                 return title, artist
         except requests.RequestException as e:
             logger.error(f"Failed to scrape track info from Spotify page: {e}")
         pass
 
+    def close(self) -> None:
+        self.session.close()
+        if self._owns_db:
+            self.db.close()
+
     def get_cached_spotify_track(self, spotify_url: str) -> Optional[Tuple[str, str]]:
         return self.db.get_cached_spotify_track(spotify_url)
 
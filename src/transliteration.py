@@ -43,9 +43,12 @@ TRANSLITERATION_MAP = {
     'ﻹ': 'laa',
     'ﻵ': 'laa',
 }
+_TRANSLITERATION_TABLE = str.maketrans(TRANSLITERATION_MAP)
 
 def transliterate_arabic(text: str) -> str:
     """Transliterate Arabic text to Latin."""
-    transliterated = ''.join(TRANSLITERATION_MAP.get(char, char) for char in text)
+    if text.isascii():
+        return text
+    transliterated = text.translate(_TRANSLITERATION_TABLE)
     logger.debug(f"Transliterated '{text}' to '{transliterated}'")
     return transliterated
@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from spotify_handler import SpotifyHandler
+
+
+class ExtractTrackIdTest(unittest.TestCase):
+    def setUp(self):
+        # extract_track_id needs no credentials, session or database
+        self.handler = SpotifyHandler.__new__(SpotifyHandler)
+
+    def test_plain_track_url(self):
+        self.assertEqual(self.handler.extract_track_id("https://open.spotify.com/track/abc"), "abc")
+
+    def test_query_and_fragment_are_ignored(self):
+        self.assertEqual(self.handler.extract_track_id("https://open.spotify.com/track/abc?si=1"), "abc")
+        self.assertEqual(self.handler.extract_track_id("https://spotify.com/track/abc/#x"), "abc")
+
+    def test_uppercase_scheme_is_accepted(self):
+        self.assertEqual(self.handler.extract_track_id("HTTPS://open.spotify.com/track/abc"), "abc")
+
+    def test_trailing_newline_is_not_part_of_the_id(self):
+        self.assertEqual(self.handler.extract_track_id("https://open.spotify.com/track/abc\n"), "abc")
+
+    def test_non_track_urls_are_rejected(self):
+        for url in (
+            "https://open.spotify.com/album/abc",
+            "https://open.spotify.com/track/abc/def",
+            "https://open.spotify.com/track/",
+            "https://open.spotify.com.evil/track/abc",
+            "https://evil.com/track/abc",
+            "open.spotify.com/track/abc",
+        ):
+            with self.subTest(url=url):
+                self.assertIsNone(self.handler.extract_track_id(url))
+
+
+if __name__ == "__main__":
+    unittest.main()